@@ -4,6 +4,7 @@ GeoPandas and regionmask, derived from Natural Earth shapefiles.
 """
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
@@ -12,9 +13,12 @@ logger = logging.getLogger(__name__)
 __version__ = "0.0.4"
 
 if TYPE_CHECKING:
+    import numpy as np
     from geopandas import GeoDataFrame
-    from pandas import Series
+    from numpy.typing import NDArray
+    from pandas import CategoricalDtype, Index, Series
     from regionmask import Regions
+    from shapely.geometry.base import BaseGeometry
 
 
 __all__: Final = [
@@ -32,17 +36,17 @@ class Region(NamedTuple):
     office: str
     """Regional office location, e.g. 'Denver'."""
 
-    constituents: list[str]
+    constituents: tuple[str, ...]
     """States/territories.
     2-letter codes, e.g. 'CO' (Colorado), 'PR' (Puerto Rico), 'GU' (Guam).
     """
 
 
-REGIONS: Final[list[Region]] = [
+REGIONS: Final[tuple[Region, ...]] = (
     Region(
         1,
         "Boston",
-        [
+        (
             "CT",
             "ME",
             "MA",
@@ -50,23 +54,23 @@ REGIONS: Final[list[Region]] = [
             "RI",
             "VT",
             # "and 10 Tribal Nations"
-        ],
+        ),
     ),
     Region(
         2,
         "New York City",
-        [
+        (
             "NJ",
             "NY",
             "PR",  # Puerto Rico
             "VI",  # US Virgin Islands
             # "and eight Indian Nations"
-        ],
+        ),
     ),
     Region(
         3,
         "Philadelphia",
-        [
+        (
             "DE",
             "DC",  # Washington DC
             "MD",
@@ -74,12 +78,12 @@ REGIONS: Final[list[Region]] = [
             "VA",
             "WV",
             # "and 7 federally recognized tribes"
-        ],
+        ),
     ),
     Region(
         4,
         "Atlanta",
-        [
+        (
             "AL",
             "FL",
             "GA",
@@ -89,12 +93,12 @@ REGIONS: Final[list[Region]] = [
             "SC",
             "TN",
             # "and 6 Tribes"
-        ],
+        ),
     ),
     Region(
         5,
         "Chicago",
-        [
+        (
             "IL",
             "IN",
             "MI",
@@ -102,35 +106,35 @@ REGIONS: Final[list[Region]] = [
             "OH",
             "WI",
             # "and 35 Tribes"
-        ],
+        ),
     ),
     Region(
         6,
         "Dallas",
-        [
+        (
             "AR",
             "LA",
             "NM",
             "OK",
             "TX",
             # "and 66 Tribal Nations"
-        ],
+        ),
     ),
     Region(
         7,
         "Kansas City",
-        [
+        (
             "IA",
             "KS",
             "MO",
             "NE",
             # "and Nine Tribal Nations"
-        ],
+        ),
     ),
     Region(
         8,
         "Denver",
-        [
+        (
             "CO",
             "MT",
             "ND",
@@ -138,12 +142,12 @@ REGIONS: Final[list[Region]] = [
             "UT",
             "WY",
             # "and 28 Tribal Nations"
-        ],
+        ),
     ),
     Region(
         9,
         "San Francisco",
-        [
+        (
             "AZ",
             "CA",
             "HI",
@@ -157,20 +161,20 @@ REGIONS: Final[list[Region]] = [
             "MH",  # Marshall Islands
             "PW",  # Palau
             # "and 148 Tribal Nations"
-        ],
+        ),
     ),
     Region(
         10,
         "Seattle",
-        [
+        (
             "AK",
             "ID",
             "OR",
             "WA",
             # "and 271 Tribal Nations"
-        ],
+        ),
     ),
-]
+)
 """Region definitions."""
 
 
@@ -187,6 +191,72 @@ _OTHER_CODE_TO_ADMIN = {
     "PW": "Palau",
 }
 _OTHER_ADMIN_TO_CODE = {v: k for k, v in _OTHER_CODE_TO_ADMIN.items()}
+_OTHER_ADMINS: Final = frozenset(_OTHER_ADMIN_TO_CODE)
+
+_WHERE: Final = "admin IN ({})".format(
+    ", ".join(f"'{a}'" for a in ["United States of America", *_OTHER_ADMIN_TO_CODE])
+)
+"""Natural Earth features we may need (US states + territories), as SQL."""
+
+_REGION_LABELS: Final = [f"R{r.number}" for r in REGIONS]
+
+_ALL_ABBREVS: Final = frozenset(c for r in REGIONS for c in r.constituents)
+
+
+def _union_all(geoms: NDArray[np.object_], *, coverage: bool = True) -> BaseGeometry:
+    """Union of the polygons in `geoms`, using the coverage union if possible.
+
+    The states/territories don't overlap, so we can use the coverage union,
+    which is much faster than the unary union.
+    But it requires a valid coverage (no overlaps, matching shared edges),
+    which isn't checked: depending on the GEOS version, it either raises
+    or returns invalid geometry (e.g. the inputs unmerged) if the inputs aren't one.
+    So if it raises or the result is invalid,
+    or `coverage` is false, we use the unary union.
+    A single geometry is returned as is.
+    """
+    import shapely
+    from shapely.ops import unary_union
+
+    if len(geoms) == 1:
+        return geoms[0]
+
+    if coverage and hasattr(shapely, "coverage_union_all"):  # Shapely 2.0+
+        from shapely.errors import GEOSException
+
+        try:
+            union = shapely.coverage_union_all(geoms)
+        except GEOSException as e:
+            logger.info(f"coverage union failed ({e}), falling back to unary union")
+        else:
+            if shapely.is_valid(union):
+                return union
+            logger.info("coverage union result invalid, falling back to unary union")
+
+    return unary_union(geoms)
+
+
+def _simplify(
+    geoms: NDArray[np.object_], tolerance: float
+) -> tuple[NDArray[np.object_], bool]:
+    """Simplify the polygons in `geoms`, preserving shared borders if possible.
+    Returns the simplified geometries and whether borders were preserved
+    (i.e. they are still a valid coverage).
+    """
+    import geopandas as gpd
+    import shapely
+
+    if hasattr(shapely, "coverage_simplify"):  # Shapely 2.1+
+        from shapely.errors import UnsupportedGEOSVersionError
+
+        try:
+            return shapely.coverage_simplify(geoms, tolerance), True
+        except UnsupportedGEOSVersionError:  # needs GEOS 3.12+
+            pass
+
+    simplified = gpd.GeoSeries(geoms).simplify(tolerance, preserve_topology=True)
+
+    return simplified.to_numpy(), False
 
 
 def get(
@@ -194,13 +264,27 @@ def get(
     resolution: str = "10m",
     version: str = "v5.1.2",
     states_only: bool = False,
+    simplify_tolerance: float | None = None,
+    force_rebuild: bool = False,
 ) -> GeoDataFrame:
     """Load EPA regions as GeoPandas GeoDataFrame.
 
     The Natural Earth shapefiles are downloaded from AWS S3 and cached locally.
+    If a pre-built GeoParquet file for this combination of options
+    is included in the package (and pyarrow is available), it is used instead.
 
     pyogrio will be used as the read engine if available, for speed.
 
+    With Shapely 2, the coordinates are snapped to a 1e-7 degree (~1 cm) grid
+    before merging, so that shared borders line up exactly.
+    Thus the region boundaries may differ very slightly
+    from the Natural Earth coordinates.
+
+    Results are cached in memory, so repeated calls with the same arguments are fast.
+    A copy is returned, so it is safe to modify.
+    If pyarrow is available, results are also cached on disk as GeoParquet,
+    alongside the shapefiles, so that they can be reused in later sessions.
+
     Parameters
     ----------
     resolution
@@ -215,26 +299,108 @@ def get(
     states_only
         States (and DC) only.
         This only has an effect for the '10m' resolution.
+    simplify_tolerance
+        If set, simplify the state/territory polygons with this tolerance
+        (in degrees, e.g. 0.01) before merging them into regions,
+        which can make the merge much faster.
+        This is lossy, but can be fine for coarse mapping/masking.
+        Shared borders are preserved if Shapely 2.1+ (with GEOS 3.12+) is available;
+        otherwise, small gaps/overlaps may appear along borders.
+    force_rebuild
+        Ignore cached results, rebuilding from the Natural Earth shapefiles
+        (and updating the on-disk cache).
     """
-    import pandas as pd
+    if force_rebuild:
+        _get.cache_clear()
+
+    gdf = _get(resolution, version, states_only, simplify_tolerance, force_rebuild)
+    gdf = gdf.copy()
+
+    # The list cells aren't copied by `copy()`
+    for c in ["constituents", "constituent_names"]:
+        gdf[c] = gdf[c].map(list)
+
+    return gdf
 
-    from .load import load
 
-    gdf = load(resolution, version=version)
+@functools.lru_cache(maxsize=8)
+def _get(
+    resolution: str,
+    version: str,
+    states_only: bool,
+    simplify_tolerance: float | None,
+    rebuild: bool,
+) -> GeoDataFrame:
+    """Memoized implementation of :func:`get`.
+    The result is shared between calls, so it should not be modified.
+    """
+    from . import cache
+
+    key = (resolution, version, states_only, simplify_tolerance)
+    if not rebuild:
+        # NOTE: The user cache dir is only consulted (and set up) if needed
+        # Any problem with the cache just means we rebuild
+        for path in [cache.prebuilt_path, cache.user_path]:
+            p = None
+            try:
+                p = path(*key)
+                if p.is_file():
+                    return cache.read(p)
+            except Exception as e:
+                logger.info(f"failed to read cached {p} ({type(e).__name__}): {e}")
+
+    gdf = _build(*key)
+
+    p = None
+    try:
+        p = cache.user_path(*key)
+        cache.write(gdf, p)
+    except Exception as e:
+        logger.info(f"failed to write cached {p} ({type(e).__name__}): {e}")
+
+    return gdf
+
+
+def _build(
+    resolution: str,
+    version: str,
+    states_only: bool,
+    simplify_tolerance: float | None = None,
+) -> GeoDataFrame:
+    """Create the EPA regions GeoDataFrame from the Natural Earth data."""
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    import geopandas as gpd
+    import numpy as np
+    import shapely
+
+    from .load import _can_use_where, load
+
+    gdf = load(
+        resolution,
+        version=version,
+        columns=["name", "admin", "postal", "iso_a2"],
+        # NOTE: same for `states_only`, so the read is shared
+        # NOTE: without `where` support (old Fiona), the rows are only filtered below
+        where=_WHERE if _can_use_where() else None,
+    ).rename(columns=str.lower)
     # NOTE: sov_a3 = 'US1' includes Guam and PR
     # NOTE: iso_a2 is the 2-letter country code
+    # NOTE: column names are uppercase in some versions
 
-    gdf.columns = gdf.columns.str.lower()
+    # Split states/territories
+    is_state = gdf["admin"] == "United States of America"
+    keep = is_state if states_only else is_state | gdf["admin"].isin(_OTHER_ADMINS)
+    gdf = gdf.loc[keep]
+    is_state = is_state[keep]
 
     #
     # States + DC
     #
 
-    states = (
-        gdf[["geometry", "name", "admin", "postal"]]
-        .query("admin == 'United States of America'")
-        .drop(columns=["admin"])
-        .rename(columns={"postal": "abbrev"})
+    states = gdf.loc[is_state, ["geometry", "name", "postal"]].rename(
+        columns={"postal": "abbrev"}
     )
 
     #
@@ -242,78 +408,92 @@ def get(
     #
 
     if states_only:
-        other = pd.DataFrame()
+        gdf = states
     else:
+        # NOTE: Territories can have multiple features; these are merged along with
+        # the rest of their region below
         other = (
-            gdf.loc[
-                gdf["admin"].isin(_OTHER_ADMIN_TO_CODE),
-                ["geometry", "name", "admin", "iso_a2"],
-            ]
-            .dissolve(by="admin", aggfunc={"name": list, "iso_a2": list})
-            .rename(columns={"name": "constituent_names"})
-            .reset_index(drop=False)
-            .assign(abbrev=lambda df: df["admin"].map(_OTHER_ADMIN_TO_CODE.get))
+            gdf.loc[~is_state, ["geometry", "admin", "iso_a2"]]
+            .sort_values("admin", kind="stable")
+            .assign(abbrev=lambda df: df["admin"].map(_OTHER_ADMIN_TO_CODE))
             .rename(columns={"admin": "name"})
         )
 
         # Check code consistency
-        for admin, iso_set in other.set_index("name")["iso_a2"].apply(set).items():
-            assert isinstance(admin, str)
-            assert len(iso_set) == 1
-            assert iso_set.pop() == _OTHER_ADMIN_TO_CODE[admin]
-
-        other = other.drop(columns=["iso_a2"])
-
-    #
-    # Combine
-    #
-
-    gdf = pd.concat([states, other], ignore_index=True, sort=False)
+        bad = other.loc[other["iso_a2"] != other["abbrev"], ["name", "iso_a2"]]
+        assert bad.empty, f"unexpected territory codes:\n{bad}"
+
+        #
+        # Combine
+        #
+
+        gdf = gpd.GeoDataFrame(
+            {
+                c: np.concatenate([states[c].to_numpy(), other[c].to_numpy()])
+                for c in ["geometry", "name", "abbrev"]
+            },
+            geometry="geometry",
+            crs=states.crs,
+        )
 
     #
     # Dissolve to EPA regions
     #
 
-    for r in REGIONS:
-        label = f"R{r.number}"
-        not_in = set(r.constituents) - set(gdf["abbrev"])
-        if states_only:
-            not_in -= _OTHER_CODE_TO_ADMIN.keys()
-        if not_in:
-            logger.info(f"{label} has unavailable states/territories: {not_in}")
-        loc = gdf["abbrev"].isin(r.constituents)
-        gdf.loc[loc, "epa_region"] = label
-        gdf.loc[loc, "epa_region_office"] = r.office
-
-    gdf = gdf.dissolve(
-        by="epa_region",
-        aggfunc={"abbrev": list, "name": list, "epa_region_office": "first"},
-    )
-
-    gdf = gdf.rename(
-        columns={
-            "abbrev": "constituents",
-            "name": "constituent_names",
-        }
-    )
+    missing = _ALL_ABBREVS.difference(gdf["abbrev"])
+    if states_only:
+        missing -= _OTHER_CODE_TO_ADMIN.keys()
+    if missing:
+        for r in REGIONS:
+            not_in = {c for c in r.constituents if c in missing}
+            if not_in:
+                logger.info(f"R{r.number} has unavailable states/territories: {not_in}")
+
+    region_codes = look_up(gdf["abbrev"]).cat.codes.to_numpy()
+    geoms = gdf.geometry.to_numpy()
+    if hasattr(shapely, "set_precision"):  # Shapely 2.0+
+        # Snap to a fine grid (~1 cm) so that nearly coincident vertices
+        # along shared borders become identical, as the coverage union requires
+        geoms = shapely.set_precision(geoms, grid_size=1e-7)
+    coverage = True
+    if simplify_tolerance is not None:
+        geoms, coverage = _simplify(geoms, simplify_tolerance)
+    abbrevs = gdf["abbrev"].to_numpy()
+    names = gdf["name"].to_numpy()
+
+    # Positions of the rows in each region, from a single (stable) sort
+    order = np.argsort(region_codes, kind="stable")
+    present, starts = np.unique(region_codes[order], return_index=True)
+    region_inds = {
+        code: inds
+        for code, inds in zip(present.tolist(), np.split(order, starts[1:]))
+        if code >= 0
+    }
+
+    # GEOS releases the GIL, so the regions can be merged in parallel
+    max_workers = max(1, min(len(region_inds), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        unions = executor.map(
+            functools.partial(_union_all, coverage=coverage),
+            [geoms[i] for i in region_inds.values()],
+        )
 
-    gdf = gdf.reset_index(drop=False)
-    gdf = (
-        gdf.assign(number=gdf["epa_region"].str.slice(1).astype(int))
-        .sort_values(by="number")
-        .reset_index(drop=True)
-    )
+    rows = []
+    for (code, inds), union in zip(region_inds.items(), unions):
+        r = REGIONS[code]
+        rows.append(
+            {
+                "epa_region": _REGION_LABELS[code],
+                "geometry": union,
+                "number": r.number,
+                "constituents": list(dict.fromkeys(abbrevs[inds])),
+                "constituent_names": list(dict.fromkeys(names[inds])),
+                "epa_region_office": r.office,
+            }
+        )
 
-    gdf = gdf[
-        [
-            "epa_region",
-            "geometry",
-            "number",
-            "constituents",
-            "constituent_names",
-            "epa_region_office",
-        ]
-    ]
+    gdf = gpd.GeoDataFrame(rows, geometry="geometry", crs=gdf.crs)
+    gdf["epa_region"] = gdf["epa_region"].astype(_region_dtype())
 
     return gdf
 
@@ -322,15 +502,13 @@ def to_regionmask(gdf: GeoDataFrame) -> Regions:
     """Convert a GeoDataFrame from the `get` function to regionmask Regions."""
     import regionmask
 
+    names = [
+        f"Region {n} ({', '.join(c)})"
+        for n, c in zip(gdf["number"].tolist(), gdf["constituents"].tolist())
+    ]
+
     rm = regionmask.from_geopandas(
-        gdf.assign(
-            name_="Region "
-            + gdf["number"].astype(str)
-            + " ("
-            + gdf["constituents"].str.join(", ")
-            + ")",
-            abbrev_=gdf["epa_region"],
-        ),
+        gdf.assign(name_=names, abbrev_=gdf["epa_region"].to_numpy()),
         numbers="number",
         names="name_",
         abbrevs="abbrev_",
@@ -360,13 +538,40 @@ def look_up(abbrs: Any, /) -> Series[str]:
     if not isinstance(abbrs, pd.Series):
         abbrs = pd.Series(abbrs)
 
-    map_ = {c: f"R{r.number}" for r in REGIONS for c in r.constituents}
-    cats = [f"R{r.number}" for r in REGIONS]
+    abbrevs, lut = _look_up_table()
+    codes = lut[abbrevs.get_indexer(abbrs)]
 
-    res: Series[str] = (
-        abbrs.map(map_)
-        .rename("epa_region")
-        .astype(pd.CategoricalDtype(cats, ordered=False))
+    res: Series[str] = pd.Series(
+        pd.Categorical.from_codes(codes, dtype=_region_dtype()),
+        index=abbrs.index,
+        name="epa_region",
     )
 
     return res
+
+
+@functools.lru_cache(maxsize=1)
+def _region_dtype() -> CategoricalDtype:
+    """Categorical dtype with the region labels ('R1', ..., 'R10') as categories."""
+    import pandas as pd
+
+    return pd.CategoricalDtype(_REGION_LABELS, ordered=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _look_up_table() -> tuple[Index, NDArray[np.int8]]:
+    """Index of all state/territory abbreviations
+    and corresponding array of region codes (region number - 1).
+    The code array has an extra -1 at the end, so that indexing with the
+    -1 that `get_indexer` returns for missing values gives -1 (NaN).
+    """
+    import numpy as np
+    import pandas as pd
+
+    abbrevs = pd.Index([c for r in REGIONS for c in r.constituents])
+    lut = np.array(
+        [r.number - 1 for r in REGIONS for _ in r.constituents] + [-1],
+        dtype=np.int8,
+    )
+
+    return abbrevs, lut
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import argparse
+from pathlib import Path
 
 parser = argparse.ArgumentParser()
 
@@ -7,32 +10,41 @@ parser.add_argument("--resolution", "-r", default="10m")
 parser.add_argument("--states-only", action="store_true")
 parser.add_argument("--axis-on", action="store_true")
 parser.add_argument("--save", action="store_true", help="otherwise show")
+parser.add_argument(
+    "--force", action="store_true", help="with --save, overwrite an existing figure"
+)
+
+FN = "epa_regions.png"
+
 
-args = parser.parse_args()
+def main(argv: list[str] | None = None) -> None:
+    args = parser.parse_args(argv)
 
-if args.info:
-    import logging
+    if args.save and not args.force and Path(FN).exists():
+        print(f"{FN} already exists, not overwriting (use --force)")
+        return
 
-    logging.basicConfig(level="INFO")
+    if args.info:
+        import logging
 
-import matplotlib.pyplot as plt
-import numpy as np
+        logging.basicConfig(level="INFO")
 
-from . import get
+    import matplotlib.pyplot as plt
+    import numpy as np
 
-regions = get(resolution=args.resolution, states_only=args.states_only)
+    from . import get
 
-fig, ax = plt.subplots(constrained_layout=True, figsize=(8, 4))
-regions.plot(column="number", cmap="tab10", ax=ax)
+    regions = get(resolution=args.resolution, states_only=args.states_only)
 
-xs = np.linspace(0.8, 0.98, 3)
-ys = np.linspace(0.98, 0.75, 4)
+    fig, ax = plt.subplots(constrained_layout=True, figsize=(8, 4))
+    regions.plot(column="number", cmap="tab10", ax=ax)
 
-i = 1
-for y in ys:
-    for x in xs:
-        if i == 10 and not x == xs[-1]:
-            continue
+    xs = np.linspace(0.8, 0.98, 3)
+    ys = np.linspace(0.98, 0.75, 4)
+
+    # R1-R9 in 3 rows, R10 alone in the last column of the 4th
+    positions = [(x, y) for y in ys[:-1] for x in xs] + [(xs[-1], ys[-1])]
+    for i, (x, y) in enumerate(positions, start=1):
         ax.text(
             x,
             y,
@@ -44,12 +56,15 @@ for y in ys:
             color=plt.cm.tab10.colors[i - 1],
             # weight="bold",
         )
-        i += 1
 
-if not args.axis_on:
-    ax.axis("off")
+    if not args.axis_on:
+        ax.axis("off")
+
+    if args.save:
+        fig.savefig(FN, dpi="figure", bbox_inches="tight")
+    else:
+        plt.show()
+
 
-if args.save:
-    fig.savefig("epa_regions.png", dpi="figure", bbox_inches="tight")
-else:
-    plt.show()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""GeoParquet storage for the finished EPA regions GeoDataFrames."""
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
+
+DATA_DIR: Final = Path(__file__).parent / "data"
+"""Location of the pre-built files shipped with the package
+(see ``scripts/build_cache.py``)."""
+
+_LIST_COLUMNS: Final = ["constituents", "constituent_names"]
+
+_PREFIX: Final = "epa-regions-"
+
+_SIDECAR: Final = "version.json"
+
+logger = logging.getLogger(__name__)
+
+
+def file_name(
+    resolution: str,
+    version: str,
+    states_only: bool,
+    simplify_tolerance: float | None = None,
+) -> str:
+    """Name of the GeoParquet file for a given set of :func:`epa_regions.get` options.
+    It includes the package version, so that files from an older version are ignored.
+    """
+    from . import __version__
+
+    stem = f"{_PREFIX}{__version__}_{resolution}_{version}"
+    if states_only:
+        stem += "_states-only"
+    if simplify_tolerance is not None:
+        # NOTE: repr of the float, not e.g. `:g`, so that distinct values can't collide
+        stem += f"_simplify-{float(simplify_tolerance)!r}"
+
+    return f"{stem}.parquet"
+
+
+def prebuilt_path(*args: Any) -> Path:
+    """Path to the pre-built file (which may not exist).
+    Arguments are passed to :func:`file_name`.
+    """
+    return DATA_DIR / file_name(*args)
+
+
+def user_path(*args: Any) -> Path:
+    """Path for the file in the user cache dir (which may not exist).
+    Arguments are passed to :func:`file_name`.
+    """
+    return user_dir() / file_name(*args)
+
+
+@functools.lru_cache(maxsize=None)
+def user_dir() -> Path:
+    """Directory for the files in the user cache dir.
+    A sidecar JSON file records the newest package version that has used it.
+    When a newer version is first used, files from older versions are removed
+    (only checked once per process).
+    Files from newer versions are left alone, so that environments
+    with different versions can share the cache dir.
+    """
+    from . import __version__
+    from .load import _get_cache_dir
+
+    d = _get_cache_dir() / "epa_regions"
+    sidecar = d / _SIDECAR
+
+    try:
+        newest = _version_tuple(json.loads(sidecar.read_text())["version"])
+    except (OSError, ValueError, KeyError, TypeError):
+        newest = None
+
+    current = _version_tuple(__version__)
+    if newest is None or current > newest:
+        try:
+            for p in d.glob(f"{_PREFIX}*.parquet"):
+                try:
+                    p_version = _version_tuple(p.name[len(_PREFIX) :])
+                except ValueError:  # not one of ours
+                    continue
+                if p_version < current:
+                    p.unlink()
+            d.mkdir(parents=True, exist_ok=True)
+            sidecar.write_text(json.dumps({"version": __version__}))
+        except OSError as e:
+            logger.info(f"Failed to clean up cache dir {d} ({type(e).__name__}): {e}")
+
+    return d
+
+
+def _version_tuple(s: str) -> tuple[int, ...]:
+    """Numeric release part of a version string, e.g. '0.1.0' -> (0, 1, 0).
+    Raises ValueError if there isn't one.
+    """
+    m = re.match(r"\d+(?:\.\d+)*", s)
+    if m is None:
+        raise ValueError(f"invalid version {s!r}")
+    return tuple(int(x) for x in m.group().split("."))
+
+
+def write(gdf: GeoDataFrame, path: Path) -> None:
+    """Write GeoParquet (requires pyarrow)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gdf.to_parquet(path, compression="zstd")
+
+
+def read(path: Path) -> GeoDataFrame:
+    """Read GeoParquet (requires pyarrow) written by :func:`write`."""
+    import geopandas as gpd
+
+    gdf = gpd.read_parquet(path)
+
+    # List columns come back as arrays
+    for col in _LIST_COLUMNS:
+        gdf[col] = gdf[col].map(list)
+
+    return gdf
@@ -1,33 +1,101 @@
 from __future__ import annotations
 
+import functools
+import re
 import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final, Sequence
 
 if TYPE_CHECKING:
     from geopandas import GeoDataFrame
 
-try:
-    import pyogrio  # noqa: F401
-except ImportError:
-    ENGINE = "fiona"
-else:
-    ENGINE = "pyogrio"  # NOTE: much faster
 
+def __getattr__(name: str) -> Any:
+    # PEP 562: only probe for the I/O libraries (which pull in GDAL) when needed
+    if name == "ENGINE":
+        return _engine()
+    elif name == "READ_KWARGS":
+        return _read_kwargs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+@functools.lru_cache(maxsize=None)
+def _engine() -> str:
+    """The :func:`geopandas.read_file` engine to use: pyogrio if available
+    (much faster), else Fiona.
+    """
+    try:
+        import pyogrio  # noqa: F401
+    except ImportError:
+        return "fiona"
+    else:
+        return "pyogrio"
+
+
+def _can_use_arrow() -> bool:
+    """Arrow reads need pyogrio 0.7+ compiled against GDAL 3.6+, and pyarrow."""
+    if _engine() != "pyogrio":
+        return False
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+
+    import pyogrio
+
+    pyogrio_version = _version(pyogrio.__version__)
+
+    return pyogrio_version >= (0, 7) and pyogrio.__gdal_version__ >= (3, 6)
+
+
+@functools.lru_cache(maxsize=None)
+def _can_use_where() -> bool:
+    """Whether :func:`geopandas.read_file` can filter with ``where``
+    (needs pyogrio or Fiona 1.9+).
+    """
+    if _engine() == "pyogrio":
+        return True
+
+    import fiona
+
+    return _version(fiona.__version__) >= (1, 9)
+
+
+def _version(s: str) -> tuple[int, int]:
+    """Major and minor version numbers from a version string, e.g. '0.7.2' -> (0, 7)."""
+    m = re.match(r"(\d+)\.(\d+)", s)
+    return (int(m.group(1)), int(m.group(2))) if m else (0, 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_kwargs() -> dict[str, Any]:
+    """Extra :func:`geopandas.read_file` keyword arguments (use Arrow if possible)."""
+    return {"use_arrow": True} if _can_use_arrow() else {}
+
+
+@functools.lru_cache(maxsize=None)
 def _get_cache_dir() -> Path:
-    """Get cache dir, trying to use the same one as regionmask."""
+    """Get cache dir, trying to use the same one as regionmask.
+    The result is cached, so regionmask's setting is only checked once.
+    """
     # TODO: look for cartopy's too or instead?
     import pooch
 
     try:
         import regionmask
-
-        cache_dir_setting = regionmask.get_options()["cache_dir"]
-    except Exception as e:
-        msg = f"Failed to get regionmask's cache dir setting ({type(e).__name__}): {e}"
-        warnings.warn(msg, stacklevel=2)
+    except ImportError:
         cache_dir_setting = None
+    else:
+        try:
+            cache_dir_setting = regionmask.get_options()["cache_dir"]
+        except Exception as e:
+            msg = (
+                "Failed to get regionmask's cache dir setting "
+                f"({type(e).__name__}): {e}"
+            )
+            warnings.warn(msg, stacklevel=2)
+            cache_dir_setting = None
 
     if cache_dir_setting is None:
         cache_dir = pooch.os_cache("regionmask")
@@ -41,6 +109,9 @@ def fetch(version: str, resolution: str, category: str, name: str) -> list[Path]
     """Retrieve locally the files from a Natural Earth zip file,
     downloading from AWS if necessary.
 
+    The paths are cached in memory, so pooch is only consulted
+    once per process for a given file.
+
     Parameters
     ----------
     version
@@ -52,6 +123,11 @@ def fetch(version: str, resolution: str, category: str, name: str) -> list[Path]
     name
         e.g. 'admin_1_states_provinces_lakes'
     """
+    return list(_fetch(version, resolution, category, name))
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch(version: str, resolution: str, category: str, name: str) -> tuple[Path, ...]:
     import pooch
 
     base_url = "https://naturalearth.s3.amazonaws.com"
@@ -78,17 +154,45 @@ def fetch(version: str, resolution: str, category: str, name: str) -> list[Path]
         processor=unzipper,
     )
 
-    return [Path(f) for f in fns]
+    return tuple(Path(f) for f in fns)
 
 
 RESOLUTIONS: Final = ["10m", "50m", "110m"]
 VERSIONS: Final = ["v4.1.0", "v5.0.0", "v5.0.1", "v5.1.0", "v5.1.1", "v5.1.2"]
 
 
-def load(resolution: str, *, version: str = "v5.1.2") -> GeoDataFrame:
-    """Load Natural Earth states/provinces/lakes."""
-    import geopandas as gpd
+def load(
+    resolution: str,
+    *,
+    version: str = "v5.1.2",
+    columns: Sequence[str] | None = None,
+    where: str | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> GeoDataFrame:
+    """Load Natural Earth states/provinces/lakes.
 
+    The result is cached in memory; a copy is returned.
+
+    Parameters
+    ----------
+    resolution
+        e.g. '50m'
+    version
+        e.g. 'v5.1.2'
+    columns
+        Attribute columns to read (the geometry is always included).
+        Matched case-insensitively, since the case varies between versions.
+        Default: all columns.
+    where
+        SQL WHERE clause to filter the features with when reading,
+        e.g. ``"admin = 'Canada'"``.
+        Requires pyogrio or Fiona 1.9+.
+        Default: all features.
+    bbox
+        Only read features intersecting this (minx, miny, maxx, maxy) box
+        (in degrees), which can use the shapefile's spatial index.
+        Default: all features.
+    """
     if resolution not in RESOLUTIONS:
         s_allowed = ", ".join(f"'{r}'" for r in RESOLUTIONS)
         raise ValueError(f"resolution must be one of: {s_allowed}. Got {resolution!r}.")
@@ -97,6 +201,24 @@ def load(resolution: str, *, version: str = "v5.1.2") -> GeoDataFrame:
         s_allowed = ", ".join(f"'{v}'" for v in VERSIONS)
         raise ValueError(f"version must be one of: {s_allowed}. Got {version!r}.")
 
+    if columns is not None:
+        columns = tuple(c.lower() for c in columns)
+    if bbox is not None:
+        bbox = tuple(bbox)  # type: ignore[assignment]
+
+    return _load(resolution, version, columns, where, bbox).copy()
+
+
+@functools.lru_cache(maxsize=4)
+def _load(
+    resolution: str,
+    version: str,
+    columns: tuple[str, ...] | None,
+    where: str | None,
+    bbox: tuple[float, float, float, float] | None,
+) -> GeoDataFrame:
+    import geopandas as gpd
+
     ps = fetch(
         version=version,
         resolution=resolution,
@@ -104,6 +226,27 @@ def load(resolution: str, *, version: str = "v5.1.2") -> GeoDataFrame:
         name="admin_1_states_provinces_lakes",
     )
 
-    (shp,) = [p for p in ps if p.name.endswith(".shp")]
+    shp = next((p for p in ps if p.suffix == ".shp"), None)
+    if shp is None:
+        raise FileNotFoundError(f"no .shp file in {[p.name for p in ps]}")
+
+    engine = _engine()
+    kwargs = _read_kwargs().copy()
+    if columns is not None and engine == "pyogrio":
+        import pyogrio
+
+        # Column selection is pushed down to GDAL
+        # NOTE: pyogrio matching is case-sensitive, so use the actual field names
+        fields = pyogrio.read_info(shp)["fields"]
+        kwargs["columns"] = [f for f in fields if f.lower() in columns]
+    if where is not None:
+        kwargs["where"] = where
+
+    gdf = gpd.read_file(shp, encoding="utf8", bbox=bbox, engine=engine, **kwargs)
+
+    if columns is not None:
+        gdf = gdf[
+            [c for c in gdf.columns if c.lower() in columns or c == gdf.geometry.name]
+        ]
 
-    return gpd.read_file(shp, encoding="utf8", bbox=None, engine=ENGINE)
+    return gdf
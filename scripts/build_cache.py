@@ -0,0 +1,25 @@
+"""
+Build the pre-built EPA regions GeoParquet files shipped with the package,
+for all combinations of `epa_regions.get` options.
+
+    python scripts/build_cache.py
+
+Re-run after bumping `epa_regions.__version__`
+(files for other package versions are removed).
+"""
+import itertools
+
+from epa_regions import _build
+from epa_regions.cache import DATA_DIR, file_name, write
+from epa_regions.load import RESOLUTIONS, VERSIONS
+
+for p in DATA_DIR.glob("*.parquet"):
+    p.unlink()
+
+for resolution, version, states_only in itertools.product(
+    RESOLUTIONS, VERSIONS, [False, True]
+):
+    fn = file_name(resolution, version, states_only)
+    print(fn)
+    gdf = _build(resolution, version, states_only)
+    write(gdf, DATA_DIR / fn)
@@ -1,12 +1,33 @@
 import itertools
+import re
 
 import pytest
 
 from epa_regions import get, REGIONS, look_up, to_regionmask
+from epa_regions.cache import user_dir as _user_dir  # before `isolated_cache`
 from epa_regions.load import RESOLUTIONS, VERSIONS
 
 versions_test = ["v4.1.0", "v5.0.0", "v5.1.2"]
 
+_RE_VER = re.compile(r"\d+\.\d+\.\d+")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache(tmp_path_factory):
+    """Use an empty temporary dir for the on-disk cache of `get` results
+    for the whole session, so that the results are built by the code under test
+    (the Natural Earth shapefiles are still taken from the user cache dir).
+    """
+    from epa_regions import _get, cache
+
+    d = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache, "DATA_DIR", d / "data")
+        mp.setattr(cache, "user_dir", lambda: d / "user")
+        _get.cache_clear()
+        yield d
+    _get.cache_clear()
+
 
 def test_versions_test_ok():
     assert set(versions_test) <= set(VERSIONS)
@@ -18,35 +39,25 @@ def test_regions_def():
 
     assert [r.number for r in REGIONS] == list(range(1, 11))
 
-    for (n1, consts1), (n2, consts2) in itertools.combinations(
-        [
-            (r.number, r.constituents)
-            for r in REGIONS
-        ],
-        2,
-    ):
-        states1_set = set(consts1)
-        states2_set = set(consts2)
-        assert len(consts1) == len(states1_set), f"R{n1} has duplicates"
-        assert len(consts2) == len(states2_set), f"R{n2} has duplicates"
-        assert not states1_set & states2_set, f"R{n1} and R{n2} share constituents"
+    seen: dict[str, int] = {}
+    for r in REGIONS:
+        for c in r.constituents:
+            assert c not in seen, f"{c} in R{r.number} and R{seen[c]}"
+            seen[c] = r.number
 
 
 def test_ne_s3_versions():
-    import re
     from pathlib import Path
 
     import s3fs
 
     s3 = s3fs.S3FileSystem(anon=True)
-    objs = s3.ls("naturalearth")
+    objs = s3.ls("naturalearth", detail=True)
 
-    re_ver = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
     version_dirs = []
-    for o in objs:
-        p = Path(o)
-        d = s3.info(o)
-        if d["type"] == "directory" and re_ver.fullmatch(p.name):
+    for d in objs:
+        p = Path(d["name"])
+        if d["type"] == "directory" and _RE_VER.fullmatch(p.name):
             version_dirs.append(p)
 
     versions = [
@@ -61,15 +72,24 @@ def test_ne_s3_versions():
     assert versions_set == se_versions_set
 
 
+@pytest.fixture(scope="session")
+def gdf(request):
+    """Result of `get` for (resolution, version), shared between tests.
+    Should not be modified.
+    """
+    resolution, version = request.param
+    return get(resolution=resolution, version=version)
+
+
 @pytest.mark.parametrize(
-    "resolution, version",
+    "gdf",
     list(itertools.product(RESOLUTIONS, versions_test)),
+    indirect=True,
+    ids="-".join,
 )
-def test_get(resolution, version):
+def test_get(gdf):
     import geopandas as gpd
 
-    gdf = get(resolution=resolution, version=version)
-
     assert isinstance(gdf, gpd.GeoDataFrame)
     assert len(gdf) == len(REGIONS) == 10
     assert list(gdf) == [
@@ -80,11 +100,48 @@ def test_get(resolution, version):
         "constituent_names",
         "epa_region_office",
     ]
+    assert gdf["epa_region"].dtype == look_up([]).dtype
+    assert gdf["number"].tolist() == list(range(1, 11))
 
     rm = to_regionmask(gdf)
     assert len(rm) == 10
 
 
+def test_load_columns_case_insensitive(tmp_path, monkeypatch):
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    from epa_regions import load
+
+    shp = tmp_path / "test.shp"
+    gpd.GeoDataFrame(
+        {"Admin": ["a"], "POSTAL": ["b"], "other": ["c"]},
+        geometry=[box(0, 0, 1, 1)],
+        crs="EPSG:4326",
+    ).to_file(shp)
+    monkeypatch.setattr(load, "fetch", lambda **kwargs: [shp])
+    load._load.cache_clear()
+    try:
+        gdf = load.load("110m", columns=["admin", "postal"])
+    finally:
+        load._load.cache_clear()
+
+    assert list(gdf) == ["Admin", "POSTAL", "geometry"]
+
+
+def test_get_no_where(cache_dir, monkeypatch):
+    from epa_regions import _get, load
+
+    gdf = get(resolution="110m")
+
+    # E.g. Fiona < 1.9
+    monkeypatch.setattr(load, "_can_use_where", lambda: False)
+    _get.cache_clear()
+    gdf2 = get(resolution="110m", force_rebuild=True)
+
+    assert gdf2.equals(gdf)
+
+
 def test_get_invalid():
     with pytest.raises(ValueError, match="resolution must be one of"):
         get(resolution="invalid", version="v5.1.2")
@@ -105,6 +162,183 @@ def test_get_states_only(resolution):
     assert len(list(itertools.chain.from_iterable(gdf["constituents"]))) == 51
 
 
+@pytest.mark.parametrize("gdf", [("50m", "v5.1.2")], indirect=True, ids="-".join)
+def test_get_simplify(gdf):
+    import shapely
+
+    gdf_s = get(resolution="50m", simplify_tolerance=0.1)
+
+    assert len(gdf_s) == len(gdf) == 10
+    assert gdf_s.is_valid.all()
+    assert gdf_s["constituents"].tolist() == gdf["constituents"].tolist()
+
+    n = shapely.get_num_coordinates(gdf.geometry.to_numpy()).sum()
+    n_s = shapely.get_num_coordinates(gdf_s.geometry.to_numpy()).sum()
+    assert n_s < n
+
+
+def test_cache_file_name_simplify():
+    from epa_regions import cache
+
+    assert cache.file_name("50m", "v5.1.2", False, 0.1) != cache.file_name(
+        "50m", "v5.1.2", False, 0.1000001
+    )
+
+
+def test_get_cached():
+    gdf1 = get(resolution="110m")
+    gdf1["number"] = -1
+    gdf1["constituents"].iloc[0].append("XX")
+    gdf2 = get(resolution="110m")
+
+    assert gdf1 is not gdf2
+    assert gdf2["number"].tolist() == list(range(1, 11))
+    assert "XX" not in gdf2["constituents"].iloc[0]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Use an empty temporary dir for the on-disk cache of `get` results
+    (the Natural Earth shapefiles are still taken from the user cache dir).
+    """
+    from epa_regions import _get, cache
+
+    pytest.importorskip("pyarrow")
+
+    monkeypatch.setattr(cache, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(cache, "user_dir", lambda: tmp_path / "user")
+    _get.cache_clear()
+    yield tmp_path
+    _get.cache_clear()
+
+
+def test_get_cached_no_fetch(cache_dir, monkeypatch):
+    from epa_regions import _get, cache, load
+
+    get(resolution="110m")
+    assert cache.user_path("110m", "v5.1.2", False).is_file()
+    _get.cache_clear()
+
+    def fetch(*args, **kwargs):
+        raise AssertionError("shouldn't fetch")
+
+    monkeypatch.setattr(load, "fetch", fetch)
+    load._load.cache_clear()
+    try:
+        gdf = get(resolution="110m")
+    finally:
+        load._load.cache_clear()
+
+    assert len(gdf) == 10
+
+
+def test_get_prebuilt(cache_dir, monkeypatch):
+    import epa_regions
+    from epa_regions import _get, cache, load
+
+    key = ("110m", "v5.1.2", False)
+    gdf = epa_regions._build(*key).assign(epa_region_office="prebuilt")
+    cache.write(gdf, cache.prebuilt_path(*key))  # like scripts/build_cache.py
+    _get.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("shouldn't build")
+
+    monkeypatch.setattr(epa_regions, "_build", fail)
+    monkeypatch.setattr(load, "fetch", fail)
+    gdf2 = get(resolution="110m")
+
+    assert gdf2.equals(gdf)
+    assert not cache.user_path(*key).exists()
+
+
+def test_cache_roundtrip(cache_dir):
+    from epa_regions import cache
+
+    gdf = get(resolution="110m")
+    p = cache_dir / cache.file_name("110m", "v5.1.2", False)
+    cache.write(gdf, p)
+    gdf2 = cache.read(p)
+
+    assert gdf2.equals(gdf)
+    assert isinstance(gdf2["constituents"].iloc[0], list)
+
+
+def test_get_force_rebuild(cache_dir):
+    from epa_regions import cache
+
+    p = cache.user_path("110m", "v5.1.2", False)
+    assert not p.exists()
+
+    gdf = get(resolution="110m", force_rebuild=True)
+
+    assert p.is_file()
+    assert cache.read(p).equals(gdf)
+
+
+@pytest.mark.parametrize("sidecar_version", [None, "0.0.0", "999.0.0"])
+def test_cache_version_sidecar(tmp_path, monkeypatch, sidecar_version):
+    import json
+
+    from epa_regions import __version__, cache, load
+
+    monkeypatch.setattr(cache, "user_dir", _user_dir)
+    monkeypatch.setattr(load, "_get_cache_dir", lambda: tmp_path)
+    d = tmp_path / "epa_regions"
+    d.mkdir()
+    if sidecar_version is not None:
+        (d / "version.json").write_text(json.dumps({"version": sidecar_version}))
+    older = d / "epa-regions-0.0.0_110m_v5.1.2.parquet"
+    newer = d / "epa-regions-999.0.0_110m_v5.1.2.parquet"
+    current = d / cache.file_name("110m", "v5.1.2", False)
+    other = d / "epa-regions-backup.parquet"
+    for p in [older, newer, current, other]:
+        p.touch()
+
+    cache.user_dir.cache_clear()
+    try:
+        assert cache.user_dir() == d
+    finally:
+        cache.user_dir.cache_clear()
+
+    assert newer.exists() and current.exists() and other.exists()
+    sidecar = json.loads((d / "version.json").read_text())
+    if sidecar_version == "999.0.0":
+        # Already cleaned up by a newer version, leave as is
+        assert older.exists()
+        assert sidecar == {"version": "999.0.0"}
+    else:
+        assert not older.exists()
+        assert sidecar == {"version": __version__}
+
+
+@pytest.mark.parametrize(
+    "polys",
+    [
+        # Overlapping
+        [[(0, 0), (2, 0), (2, 1), (0, 1)], [(1, 0), (3, 0), (3, 1), (1, 1)]],
+        # Jittered shared edge
+        [
+            [(0, 0), (1, 0), (1, 1), (0, 1)],
+            [(1 - 1e-9, 0), (2, 0), (2, 1), (1 - 1e-9, 1)],
+        ],
+    ],
+)
+def test_union_all_invalid_coverage(polys):
+    import numpy as np
+    from shapely.geometry import Polygon
+    from shapely.ops import unary_union
+
+    from epa_regions import _union_all
+
+    geoms = np.array([Polygon(p) for p in polys])
+    union = _union_all(geoms)
+
+    assert union.is_valid
+    assert union.geom_type == "Polygon"
+    assert union.area == pytest.approx(unary_union(geoms).area)
+
+
 def test_look_up():
     import pandas as pd
 
@@ -118,3 +352,8 @@ def test_look_up():
 
     input_series = pd.Series(input_list)
     assert look_up(input_series).tolist() == expected
+
+    s = look_up(pd.Series(["CO", "XX", None], index=[3, 2, 1]))
+    assert s.index.tolist() == [3, 2, 1]
+    assert s.iloc[0] == "R8"
+    assert s.iloc[1:].isna().all()